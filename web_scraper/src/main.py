@@ -1,12 +1,123 @@
-from concurrent.futures.thread import ThreadPoolExecutor
+import argparse
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
 
+import aiohttp
 import pandas as pd
 
-from web_scraper.src.monsters_scraper import parse_monster_page
-from web_scraper.src.utils import flatten, get_monster_links, get_page_content
+from web_scraper.src.model import Monster
+from web_scraper.src.monsters_scraper import parse_monster_page_from_bytes
+from web_scraper.src.utils import HEADERS, get_monster_links, \
+    get_page_content
+
+MAX_CONCURRENT_REQUESTS = 30
+
+# explicit narrow dtypes for the dataset columns; the nullable pandas types
+# keep the None values fields get when parsing misses them, while the frame
+# stays far smaller than inferred object/float64 columns
+_COLUMN_DTYPES = {
+    "link": "string", "name": "string",
+    "CR": "Float32", "XP": "Int32",
+    "alignment": "string", "size": "string", "type": "string",
+    "init": "Int32", "senses": "Int32", "perception": "Int32",
+    "AC": "Int32", "touch": "Int32", "flat_footed": "Int32",
+    "HP": "Int32", "HD": "Int32",
+    "fortitude": "Int32", "reflex": "Int32", "will": "Int32",
+    "speed": "Int32", "burrow": "Int32", "climb": "Int32",
+    "fly": "Int32", "swim": "Int32",
+    "highest_attack_bonus": "Int32",
+    "melee_attacks_num": "Int32", "melee_median_dmg": "Float32",
+    "ranged_attacks_num": "Int32", "ranged_median_dmg": "Float32",
+    "space": "Float32", "reach": "Int32",
+    "strength": "Int32", "dexterity": "Int32", "constitution": "Int32",
+    "intelligence": "Int32", "wisdom": "Int32", "charisma": "Int32",
+    "BAB": "Int32", "CMB": "Int32", "CMD": "Int32",
+    "feats_num": "Int32", "skills_num": "Int32",
+}
+
+
+async def fetch_page(session: aiohttp.ClientSession, link: str):
+    """
+    Downloads the page content, or returns None if it can't be used.
+
+    :param session: shared aiohttp client session
+    :param link: hyperlink to page
+    :return: response content or None
+    """
+    async with session.get(link) as response:
+        content = await response.read()
+
+    # like in get_page_content, code 404 with a suggestions page is still
+    # usable content
+    if response.status != 200 \
+            and b"We've found at least one possible match" not in content:
+        return None
+
+    return content
+
+
+async def crawl(links):
+    """
+    Fetches and parses all monster pages concurrently. Links discovered
+    during parsing (subpages, redirect suggestions) go back into the shared
+    work queue, so they are spread over all workers instead of being
+    fetched serially by whichever worker found them.
+
+    :param links: hyperlinks to monster pages
+    :return: list of parsed monsters
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    loop = asyncio.get_running_loop()
+
+    monsters = []
+    pending = list(links)
+    seen = set(links)
+
+    # parsing is pure-Python CPU work serialized by the GIL, so it goes to
+    # worker processes; thanks to the on-disk feats cache the workers import
+    # the parser without hitting the network
+    parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=HEADERS) as session:
+        async def parse_link(link):
+            async with semaphore:
+                try:
+                    content = await fetch_page(session, link)
+                except aiohttp.ClientError:
+                    return None
+            if content is None:
+                return None
+            return await loop.run_in_executor(
+                parse_pool, parse_monster_page_from_bytes, content, link)
+
+        while pending:
+            batch, pending = pending, []
+            results = await asyncio.gather(*(parse_link(link)
+                                             for link in batch))
+            for result in results:
+                if result is None:
+                    continue
+                parsed, new_links = result
+                monsters += parsed
+                for new_link in new_links:
+                    if new_link not in seen:
+                        seen.add(new_link)
+                        pending.append(new_link)
+
+    parse_pool.shutdown()
+    return monsters
+
 
 if __name__ == "__main__":
-    MAX_THREADS = 30
+    parser = argparse.ArgumentParser(
+        description="Scrapes d20pfsrd.com monster pages into a dataset.")
+    parser.add_argument("--csv", action="store_true",
+                        help="also write a human-readable CSV file")
+    args = parser.parse_args()
 
     # get links for monster listings for all monsters on the page
     html: str = get_page_content(
@@ -19,18 +130,20 @@ if __name__ == "__main__":
     # not "proper" monster living out in the game world
     monster_links = [link for link in monster_links if "summon" not in link]
 
-    # if there are less than MAX_THREADS links, spawn less threads,
-    # so they are not wasted
-    num_threads = min(MAX_THREADS, len(monster_links))
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        # asynchronous, threads will return results when they finish their
-        # own work
-        results = [result for result
-                   in executor.map(parse_monster_page, monster_links)]
+    monsters = asyncio.run(crawl(monster_links))
 
-    results = [vars(monster) for monster in flatten(results) if monster]
+    # build the DataFrame column-wise: one list per Monster field lets pandas
+    # type each column in one go, instead of probing a dict per row
+    columns = {field.name: [getattr(monster, field.name)
+                            for monster in monsters]
+               for field in fields(Monster)}
 
-    # since Monster class just holds variables, it's safe and fast to use vars
-    dataframe = pd.DataFrame(results)
+    dataframe = pd.DataFrame(columns).astype(_COLUMN_DTYPES)
 
-    dataframe.to_csv("dataset_v1.csv", index_label="index", na_rep="NULL")
+    # Parquet keeps the column types, compresses well and skips the
+    # number-to-text conversion CSV writing pays for every cell
+    dataframe.to_parquet("dataset_v1.parquet", engine="pyarrow",
+                         compression="zstd", index=False)
+    if args.csv:
+        dataframe.to_csv("dataset_v1.csv", index_label="index",
+                         na_rep="NULL")
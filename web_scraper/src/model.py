@@ -1,67 +1,71 @@
+from dataclasses import dataclass, fields
 from typing import Union
 
 
+@dataclass(slots=True)
 class Monster:
-    def __init__(self):
-        # technical details
-        self.link: str = ""
-
-        # basic info
-        self.name: str = ""
-        self.CR: Union[float, None] = None
-        self.XP: Union[int, None] = None
-        self.alignment: Union[str, None] = None
-        self.size: Union[str, None] = None
-        self.type: Union[str, None] = None
-        self.init: Union[int, None] = None
-        self.senses: int = 0
-        self.perception: Union[int, None] = None
-
-        # defense
-        self.AC: Union[int, None] = None
-        self.touch: Union[int, None] = None
-        self.flat_footed: Union[int, None] = None
-
-        self.HP: Union[int, None] = None
-        self.HD: Union[int, None] = None
-
-        self.fortitude: Union[int, None] = None
-        self.reflex: Union[int, None] = None
-        self.will: Union[int, None] = None
-
-        # offense
-        self.speed: int = 0
-        self.burrow: int = 0
-        self.climb: int = 0
-        self.fly: int = 0
-        self.swim: int = 0
-
-        self.highest_attack_bonus: int = 0
-
-        self.melee_attacks_num: int = 0
-        self.melee_median_dmg: int = 0
-        
-        self.ranged_attacks_num: int = 0
-        self.ranged_median_dmg: int = 0
-
-        self.space: int = 5
-        self.reach: int = 5
-
-        # statistics
-        self.strength: Union[int, None] = None
-        self.dexterity: Union[int, None] = None
-        self.constitution: Union[int, None] = None
-        self.intelligence: Union[int, None] = None
-        self.wisdom: Union[int, None] = None
-        self.charisma: Union[int, None] = None
-
-        self.BAB: Union[int, None] = None
-        self.CMB: Union[int, None] = None
-        self.CMD: Union[int, None] = None
-
-        self.feats_num: int = 0
-        self.skills_num: int = 0
+    # slots=True removes the per-instance __dict__ (the scraper creates
+    # thousands of these) and makes attribute access an offset load
+
+    # technical details
+    link: str = ""
+
+    # basic info
+    name: str = ""
+    CR: Union[float, None] = None
+    XP: Union[int, None] = None
+    alignment: Union[str, None] = None
+    size: Union[str, None] = None
+    type: Union[str, None] = None
+    init: Union[int, None] = None
+    senses: int = 0
+    perception: Union[int, None] = None
+
+    # defense
+    AC: Union[int, None] = None
+    touch: Union[int, None] = None
+    flat_footed: Union[int, None] = None
+
+    HP: Union[int, None] = None
+    HD: Union[int, None] = None
+
+    fortitude: Union[int, None] = None
+    reflex: Union[int, None] = None
+    will: Union[int, None] = None
+
+    # offense
+    speed: int = 0
+    burrow: int = 0
+    climb: int = 0
+    fly: int = 0
+    swim: int = 0
+
+    highest_attack_bonus: int = 0
+
+    melee_attacks_num: int = 0
+    melee_median_dmg: float = 0
+
+    ranged_attacks_num: int = 0
+    ranged_median_dmg: float = 0
+
+    space: int = 5
+    reach: int = 5
+
+    # statistics
+    strength: Union[int, None] = None
+    dexterity: Union[int, None] = None
+    constitution: Union[int, None] = None
+    intelligence: Union[int, None] = None
+    wisdom: Union[int, None] = None
+    charisma: Union[int, None] = None
+
+    BAB: Union[int, None] = None
+    CMB: Union[int, None] = None
+    CMD: Union[int, None] = None
+
+    feats_num: int = 0
+    skills_num: int = 0
 
     def __repr__(self):
-        return "\n".join(f"{attr}: {val}"
-                         for attr, val in vars(self).items())
+        return "\n".join(f"{field.name}: {getattr(self, field.name)}"
+                         for field in fields(self))
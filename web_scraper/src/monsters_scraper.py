@@ -1,29 +1,282 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
-from statistics import median
 
-from bs4 import BeautifulSoup
+import ahocorasick
+import numpy as np
+from selectolax.lexbor import LexborHTMLParser
 
 from web_scraper.src.model import Monster
 from web_scraper.src.utils import *  # we use all utility functions
+from web_scraper.src.utils import _THIRD_PARTY_RE
+
+# threads only read this, so it's safe; frozen to make that explicit
+all_feats_names = frozenset(get_feats_names())
+
+# all patterns are precompiled at module load - they are used for every parsed
+# monster page, so this skips the lookup in the re module pattern cache that
+# every re.search(string, text) call performs; patterns spanning lines use
+# "." with re.DOTALL rather than the [\s\S] class, which the engine can
+# optimize better
+_STAT_BLOCK_START_RE = re.compile(r"CR\s*[0-9/]+\)?\s*?\(?XP")
+_SUGGESTION_RE = re.compile(r"We've found at least one possible match "
+                            r"for the page you really want(.*)", re.DOTALL)
+_SUGGESTION_LINK_RE = re.compile(r'<a href="(.*?)">')
+_NAME_RE = re.compile(r"\n(.+)\s*\(?\s*CR\s*[0-9/]*\s*\)?\s*\(?XP")
+
+# the basic info / defense / offense split is done with str.partition on the
+# literal headers; the statistics part keeps a pattern because its match
+# includes the "STATISTICS" header and trims trailing paragraphs
+_STATISTICS_BLOCK_RE = re.compile(r"STATISTICS(.+)\n\n|"
+                                  r"STATISTICS\n([\S ]+)|"
+                                  r"STATISTICS(.+)", re.DOTALL)
+
+_CR_RE = re.compile(r"CR\s+\(?(.+?)\)?\s+")
+# CR is almost always one of a few dozen known strings; a lookup table avoids
+# constructing Fractions for them (".5" comes from the -1/2 notation fixup)
+_CR_MAP = {str(n): float(n) for n in range(31)}
+_CR_MAP.update({"1/8": 0.125, "1/6": 1 / 6, "1/4": 0.25, "1/3": 1 / 3,
+                "1/2": 0.5, ".5": 0.5})
+_XP_RE = re.compile(r"XP\s+([0-9,]+)\)?")
+_ALIGNMENT_RE = re.compile(r"(LG|NG|CG|LN|CN|LE|NE|CE|N)")
+_SIZE_RE = re.compile(r"(Fine|Diminutive|Tiny|Small|Medium|Large|Huge|"
+                      r"Gargantuan|Colossal)")
+_TYPE_RE = re.compile(r"(aberration|animal|construct|dragon|fey|"
+                      r"humanoid|magical beast|monstrous humanoid|"
+                      r"ooze|outsider|plant|undead|vermin)")
+_INIT_RE = re.compile(r"Init\s+(0|\+[0-9]+|-[0-9]+)")
+# bounded lazy windows between the anchor words make a mismatch on a
+# malformed page fail fast instead of backtracking over the whole block
+_SENSES_RE = re.compile(r"Senses(.{0,300});", re.DOTALL)
+_DETECT_RE = re.compile("detect")
+_SENSES_NAMES = ("blindsense", "blindsight", "greensight", "darkvision",
+                 "lifesense", "low-light vision", "mistsight", "scent",
+                 "thoughtsense", "tremorsense", "true seeing")
+# one alternation scan over the senses line instead of a substring search
+# per sense name; longest-first ordering like for skills
+_SENSES_ALT_RE = re.compile(
+    "|".join(sorted(_SENSES_NAMES, key=len, reverse=True)))
+_PERCEPTION_RE = re.compile(r"Perception\s+(0|\+[0-9]+|-[0-9]+)")
+
+_ARMOR_RE = re.compile(r"AC\s+([0-9]+).{0,200}?"
+                       r"touch\s+([0-9]+).{0,200}?"
+                       r"flat-footed\s+([0-9]+)", re.DOTALL)
+_HP_HD_RE = re.compile(r"hp\s+([0-9]+)\s+\(([0-9]+)d")
+_SAVES_RE = re.compile(r"Fort\s+(0|\+[0-9]+|-[0-9]+).{0,120}?"
+                       r"Ref\s+(0|\+[0-9]+|-[0-9]+).{0,120}?"
+                       r"Will\s+(0|\+[0-9]+|-[0-9]+)", re.DOTALL)
+
+_SPEED_RE = re.compile(r"Speed\s+([0-9]+)")
+_MOVEMENT_RE = re.compile(r"(burrow|climb|fly)\s+([0-9]+)")
+_ATTACKS_RE = re.compile(r"(Melee|Ranged)(.+)"
+                         r"(Space|Reach|Special Attacks|Spell-Like Abilities)",
+                         re.DOTALL)
+_ATTACK_DMG_RE = re.compile(r".+\([0-9]+d.+", re.DOTALL)
+_SPACE_RE = re.compile(r"Space\s+([0-9.]+)")
+_REACH_RE = re.compile(r"Reach\s+([0-9]+)")
+
+# like _MOVEMENT_RE, one alternation pass catches all six attributes at once
+_ATTRIBUTES_RE = re.compile(r"(Str|Dex|Con|Int|Wis|Cha)\s*([0-9]+)")
+_ATTRIBUTE_NAMES = {"Str": "strength",
+                    "Dex": "dexterity",
+                    "Con": "constitution",
+                    "Int": "intelligence",
+                    "Wis": "wisdom",
+                    "Cha": "charisma"}
+_BAB_CMB_CMD_RE = re.compile(r"Base\s*Atk\s*(0|\+[0-9]+|-[0-9]+).{0,60}?"
+                             r"CMB\s*(0|\+[0-9]+|-[0-9]+).{0,60}?"
+                             r"CMD\s*[-+]?(0|[0-9]+)", re.DOTALL)
+_BAB_RE = re.compile(r"Base\s*Atk\s*(0|\+[0-9]+|-[0-9]+)")
+_CMB_RE = re.compile(r"CMB\s*(0|\+[0-9]+|-[0-9]+)")
+_CMD_RE = re.compile(r"CMD\s*[-+]?(0|[0-9]+)")
+_FEATS_RE = re.compile(r"Feats(.+?)Skills", re.DOTALL)
+_SKILLS_RE = re.compile(r"Skills(.+)", re.DOTALL)
+_KNOWLEDGE_RE = re.compile("Knowledge")
+_CRAFT_RE = re.compile("Craft")
+
+# declarative single-group fields as (attribute, pattern, converter) rows;
+# one generic loop in _parse_simple_fields replaces a search + convert +
+# assign block per field
+_BASIC_INFO_FIELDS = (
+    ("alignment", _ALIGNMENT_RE, str),
+    ("size", _SIZE_RE, str),
+    ("type", _TYPE_RE, str.capitalize),
+    ("init", _INIT_RE, int),
+    ("perception", _PERCEPTION_RE, int),
+)
+_OFFENSE_FIELDS = (
+    ("speed", _SPEED_RE, int),
+    ("space", _SPACE_RE, lambda value: round(float(value), 1)),
+    ("reach", _REACH_RE, int),
+)
+
+_SKILLS_NAMES = frozenset({
+    "Acrobatics", "Appraise", "Bluff", "Climb", "Diplomacy",
+    "Disable Device", "Disguise", "Escape Artist", "Fly",
+    "Handle Animal", "Heal", "Intimidate", "Linguistics",
+    "Perception", "Perform", "Profession", "Ride",
+    "Sense Motive", "Sleight of Hand", "Spellcraft",
+    "Stealth", "Survival", "Swim", "Use Magic Device"})
+_SKILLS_ALT_RE = re.compile(
+    "|".join(re.escape(skill)
+             for skill in sorted(_SKILLS_NAMES, key=len, reverse=True)))
+
+# Aho-Corasick automaton over all known feat names; one linear C scan finds
+# every feat occurrence regardless of how many hundreds of names are known
+_FEATS_AUTOMATON = ahocorasick.Automaton()
+for _feat in all_feats_names:
+    _FEATS_AUTOMATON.add_word(_feat, len(_feat))
+_FEATS_AUTOMATON.make_automaton()
+
+
+def _count_feats(feats_str: str) -> int:
+    """
+    Counts known feat names in the feats part of the stat block via one
+    Aho-Corasick scan, keeping only whole-word, longest, non-overlapping
+    matches (so e.g. "Greater Bull Rush" is one feat, not also "Bull Rush").
+
+    :param feats_str: feats part of the statistics block
+    :return: number of feats found
+    """
+    matches = []
+    for end, length in _FEATS_AUTOMATON.iter(feats_str):
+        start = end - length + 1
+        # the automaton knows nothing about word boundaries, so drop matches
+        # glued to surrounding letters or digits
+        if start > 0 and feats_str[start - 1].isalnum():
+            continue
+        if end + 1 < len(feats_str) and feats_str[end + 1].isalnum():
+            continue
+        matches.append((start, end))
+
+    # prefer the longest match at each position, then skip anything
+    # overlapping it
+    matches.sort(key=lambda match: (match[0], -match[1]))
+    count = 0
+    last_end = -1
+    for start, end in matches:
+        if start > last_end:
+            count += 1
+            last_end = end
+
+    return count
+
+
+_MAX_FETCH_THREADS = 8
+
+
+def _fetch_page_or_none(link: str) -> Union[bytes, None]:
+    try:
+        return get_page_content(link)
+    except ConnectionError:
+        # may happen if page is malformed
+        return None
+
+
+def _extract_stat_block(text: str) -> Union[str, None]:
+    """
+    Cuts the monster stat block out of the page text. The block starts at
+    the "CR ... XP" header and ends at "SPECIAL ABILITIES" when present,
+    otherwise after the STATISTICS section (trailing paragraphs trimmed at
+    the last blank line). Finding the anchors with str.find replaces the
+    old three-way alternation regex, whose branches each rescanned the
+    page and backtracked heavily when one anchor was missing.
+
+    :param text: full text of the monster page
+    :return: stat block substring, or None if there is none
+    """
+    start = _STAT_BLOCK_START_RE.search(text)
+    if not start:
+        return None
+    start = start.start()
+
+    end = text.find("SPECIAL ABILITIES", start)
+    if end != -1:
+        return text[start:end]
+
+    statistics = text.find("STATISTICS", start)
+    if statistics == -1:
+        return None
 
-all_feats_names = get_feats_names()  # threads only read this, so it's safe
+    end = text.rfind("\n\n")
+    if end > statistics:
+        return text[start:end]
+
+    return text[start:]
 
 
 def parse_monster_page(link: str) -> Union[List[Monster], None]:
     """
-    Parses statistics of the monster from its page.
+    Fetches the monster page and parses its statistics, following subpage
+    and suggestion links through an explicit work queue instead of
+    recursing per link. Each wave of discovered links is downloaded in
+    parallel, so subpage indexes with dozens of children cost roughly one
+    round-trip instead of one per child.
 
     :param link: hyperlink to monster page
-    :return: either a single monster info or list of monsters
+    :return: list of monsters, or None if nothing could be parsed
     """
-    try:
-        content_bytes: bytes = get_page_content(link)
-    except ConnectionError as e:
-        # may happen if page is malformed
+    # reject 3rd party content before spending a network round-trip on it
+    if _THIRD_PARTY_RE.search(link):
         return None
-    soup = BeautifulSoup(content_bytes, "html.parser")
+
+    monsters = []
+    pending = [link]
+    seen = {link}
+
+    while pending:
+        with ThreadPoolExecutor(
+                max_workers=min(_MAX_FETCH_THREADS,
+                                len(pending))) as executor:
+            contents = list(executor.map(_fetch_page_or_none, pending))
+
+        batch, pending = pending, []
+        for current, content_bytes in zip(batch, contents):
+            if content_bytes is None:
+                continue
+
+            parsed, new_links = parse_monster_page_from_bytes(content_bytes,
+                                                              current)
+            monsters += parsed
+            for new_link in new_links:
+                if new_link not in seen:
+                    seen.add(new_link)
+                    pending.append(new_link)
+
+    return monsters if monsters else None
+
+
+def parse_monster_page_from_bytes(
+        content_bytes: bytes, link: str) -> Tuple[List[Monster], List[str]]:
+    """
+    Parses statistics of the monster from already downloaded page content.
+    This is the CPU part of parse_monster_page, split out so asynchronous
+    fetchers can hand over the downloaded bytes directly. Links to further
+    pages (subpages, redirect suggestions) are returned to the caller
+    instead of being fetched here, so the dispatcher can parallelize them.
+
+    :param content_bytes: raw content of the monster page
+    :param link: hyperlink the content was downloaded from
+    :return: tuple of (parsed monsters, links to pages still to process)
+    """
+    # some 3rd party links reach this point through redirects; drop them
+    # before doing any parsing work
+    if _THIRD_PARTY_RE.search(link):
+        return [], []
+    # selectolax's lexbor backend parses HTML in C with SIMD-accelerated
+    # scanning; text() concatenates the text nodes just like BeautifulSoup's
+    # get_text() did
+    # decode once and share the string between the DOM parser and the
+    # regex-based subpages extractor
     html: str = content_bytes.decode("utf-8")
-    text: str = soup.get_text()
+    tree = LexborHTMLParser(html)
+
+    # the stat block lives in the article body; extracting text just from it
+    # skips menus, sidebars and footers, which shrinks the string all the
+    # downstream regexes scan; fall back to the whole page if the theme ever
+    # changes the container
+    article = tree.css_first("div.article-content, article, main")
+    text: str = article.text() if article else tree.text()
 
     # replace non-standard dash with a regular ASCII one
     text = text.replace("–", "-")
@@ -36,51 +289,36 @@ def parse_monster_page(link: str) -> Union[List[Monster], None]:
     text = text.replace("Xp", "XP")
 
     # reduce text to the interesting part
-    stat_block = re.search(
-        r"(CR\s*[0-9/]+\)?[\s]*?\(?XP[\S\s]*?)SPECIAL ABILITIES|"
-        r"(CR\s*[0-9/]+\)?[\s]*?\(?XP[\S\s]*?STATISTICS[\S\s]*)\n\n|"
-        r"(CR\s*[0-9/]+\)?[\s]*?\(?XP[\S\s]*?STATISTICS[\S\s]*)",
-        text)
+    stat_block = _extract_stat_block(text)
 
     # also get additional pages that may be linked; may be empty list
-    subpages_links = get_subpages_links(html)
-    subpages_monsters = [parse_monster_page(link) for link in subpages_links
-                         if "summon" not in link]
-
-    # filter out possible None values
-    subpages_monsters = [monster for monster in subpages_monsters if monster]
-
-    subpages_monsters = flatten(subpages_monsters)
+    pending_links = [subpage_link
+                     for subpage_link in get_subpages_links(html)
+                     if "summon" not in subpage_link
+                     and not _THIRD_PARTY_RE.search(subpage_link)]
 
     if not stat_block:
         # we may have a malformed URL, but d20pfsrd managed to create a
         # suggestions page with redirects
-        suggestion = re.search(r"We've found at least one possible match "
-                               r"for the page you really want([\s\S]*)",
-                               html)
+        suggestion = _SUGGESTION_RE.search(html)
         if suggestion:
             suggestion = suggestion.group(1)
-            link = re.search(r'<a href="(.*?)">', suggestion)
-            if link:
-                link = link.group(1)
-                monster = parse_monster_page(link)
-                result = [monster] + subpages_monsters
-                return result
-        else:
-            return subpages_monsters if subpages_monsters else None
+            suggested_link = _SUGGESTION_LINK_RE.search(suggestion)
+            if suggested_link:
+                pending_links.append(suggested_link.group(1))
+        return [], pending_links
 
     # get all the information about the monster; if we don't get something, we
     # will have the default value from the Monster constructor
     monster = Monster()
     monster.link = link
-    stat_block = stat_block.group()
 
-    name = re.search(r"\n(.+)\s*\(?\s*CR\s*[0-9/]*\s*\)?\s*\(?XP", text)
+    name = _NAME_RE.search(text)
     if name:
         name = name.group(1).strip()
         if "3pp" in name:
             # some things slip though previous 3rd party content filters
-            return None
+            return [], pending_links
 
         if name.endswith("("):
             name = name[:-1].rstrip().title()
@@ -88,20 +326,29 @@ def parse_monster_page(link: str) -> Union[List[Monster], None]:
         monster.name = name
     else:
         # if we don't know the monster's name, omit it
-        return None
+        return [], pending_links
+
+    # division into separate blocks for parsing makes further regexes
+    # faster; the section headers are fixed literals, so C-level partition
+    # and find calls split the block without any regex work
+    basic_info_block, sep, rest = stat_block.partition("DEFENSE")
+    if not sep:
+        return [], pending_links
+
+    defense_block, sep, rest = rest.partition("OFFENSE")
+    if not sep:
+        return [], pending_links
+
+    # the offense block runs until TACTICS or STATISTICS, whichever is first
+    section_ends = [index for index in (rest.find("TACTICS"),
+                                        rest.find("STATISTICS"))
+                    if index != -1]
+    if not section_ends:
+        return [], pending_links
+    offense_block = rest[:min(section_ends)]
 
     try:
-        # division into separate blocks for parsing makes further regrexes faster
-        basic_info_block = re.search(r"([\s\S]+?)DEFENSE",
-                                     stat_block).group(1)
-        defense_block = re.search(r"DEFENSE([\s\S]+?)OFFENSE",
-                                  stat_block).group(1)
-        offense_block = re.search(r"OFFENSE([\s\S]+?)(TACTICS|STATISTICS)",
-                                  stat_block).group(1)
-        statistics_block = re.search(r"STATISTICS([\s\S]+)\n\n|"
-                                     r"STATISTICS\n([\S ]+)|"
-                                     r"STATISTICS([\s\S]+)",
-                                     stat_block).group()
+        statistics_block = _STATISTICS_BLOCK_RE.search(stat_block).group()
 
         parse_basic_info(basic_info_block, monster)
         parse_defense(defense_block, monster)
@@ -110,10 +357,25 @@ def parse_monster_page(link: str) -> Union[List[Monster], None]:
     except AttributeError:
         # some pages have errors in sections (e. g. 3 "statistics" sections),
         # they throw exceptions as regexes can't recognize sections
-        return None
+        return [], pending_links
+
+    return [monster], pending_links
 
-    result = [monster] + subpages_monsters
-    return result
+
+def _parse_simple_fields(stat_block: str, monster: Monster,
+                         fields_table) -> None:
+    """
+    Fills monster fields that need just a single regex group and a converter,
+    driven by a (attribute, pattern, converter) table.
+
+    :param stat_block: string with the monster statistics block
+    :param monster: Monster class object to fill
+    :param fields_table: iterable of (attribute, pattern, converter) rows
+    """
+    for attr, pattern, convert in fields_table:
+        match = pattern.search(stat_block)
+        if match:
+            setattr(monster, attr, convert(match.group(1)))
 
 
 def parse_basic_info(stat_block: str, monster: Monster) -> None:
@@ -125,62 +387,36 @@ def parse_basic_info(stat_block: str, monster: Monster) -> None:
     :param stat_block: string with the monster statistics block
     :param monster: Monster class object to fill
     """
-    CR = re.search(r"CR\s+\(?(.+?)\)?\s+", stat_block)
+    CR = _CR_RE.search(stat_block)
     if CR:
-        # this handles fractional CRs through interpreting all numbers as
-        # (potentially space-divided) Fraction strings
-        CR = CR.group(1) if CR.group(1) else CR.group(2)
-        monster.CR = float(sum(Fraction(s) for s in CR.split()))
-
-    XP = re.search(r"XP\s+([0-9]+,[0-9]+)\)?|"
-                   r"XP\s+([0-9]+)\)?", stat_block)
+        CR = CR.group(1)
+        try:
+            monster.CR = sum(_CR_MAP[part] for part in CR.split())
+        except KeyError:
+            # unusual notation: fall back to interpreting all numbers as
+            # (potentially space-divided) Fraction strings
+            monster.CR = float(sum(Fraction(s) for s in CR.split()))
+
+    XP = _XP_RE.search(stat_block)
     if XP:
-        XP = XP.group(1) if XP.group(1) else XP.group(2)
-        XP = XP.replace(",", "")
-        monster.XP = int(XP)
-
-    alignment = re.search(r"(LG|NG|CG|LN|CN|LE|NE|CE|N)", stat_block)
-    if alignment:
-        monster.alignment = alignment.group(1)
+        monster.XP = int(XP.group(1).replace(",", ""))
 
     # there are typos like this one in some descriptions
     stat_block = stat_block.replace("Diminuitive", "Diminutive")
 
-    size = re.search(r"(Fine|Diminutive|Tiny|Small|Medium|Large|Huge|"
-                     r"Gargantuan|Colossal)",
-                     stat_block)
-    if size:
-        monster.size = size.group(1)
-
-    creature_type = re.search(r"(aberration|animal|construct|dragon|fey|"
-                              r"humanoid|magical beast|monstrous humanoid|"
-                              r"ooze|outsider|plant|undead|vermin)",
-                              stat_block)
-    if creature_type:
-        monster.type = creature_type.group(1).capitalize()
+    _parse_simple_fields(stat_block, monster, _BASIC_INFO_FIELDS)
 
-    init = re.search(r"Init\s+(0|\+[0-9]+|-[0-9]+)", stat_block)
-    if init:
-        monster.init = int(init.group(1))
-
-    senses = re.search(r"Senses([\S\s]+);", stat_block)
+    senses = _SENSES_RE.search(stat_block)
     if senses:
         # get rid of problematic punctuation
         senses = senses.group(1).replace(",", "").replace(".", "")
 
         # count "detect magic", "detect evil" etc. as senses
-        monster.senses = len(re.findall("detect", senses))
-
-        # all other senses
-        for sense in ["blindsense", "blindsight", "greensight", "darkvision",
-                      "lifesense", "low-light vision", "mistsight", "scent",
-                      "thoughtsense", "tremorsense", "true seeing"]:
-            if sense in senses:
-                monster.senses += 1
+        monster.senses = len(_DETECT_RE.findall(senses))
 
-    perception = re.search(r"Perception\s+(0|\+[0-9]+|-[0-9]+)", stat_block)
-    if perception:
-        monster.perception = int(perception.group(1))
+        # all other senses; the set keeps each sense counted once, as with
+        # the old per-name substring checks
+        monster.senses += len(set(_SENSES_ALT_RE.findall(senses)))
 
 
 def parse_defense(stat_block: str, monster: Monster) -> None:
@@ -191,24 +427,18 @@ def parse_defense(stat_block: str, monster: Monster) -> None:
     :param stat_block: string with the monster statistics block
     :param monster: Monster class object to fill
     """
-    armor = re.search(r"AC\s+([0-9]+)[\s\S]+"
-                      r"touch\s+([0-9]+)[\s\S]+"
-                      r"flat-footed\s+([0-9]+)",
-                      stat_block)
+    armor = _ARMOR_RE.search(stat_block)
     if armor:
         monster.AC = int(armor.group(1))
         monster.touch = int(armor.group(2))
         monster.flat_footed = int(armor.group(3))
 
-    HP_and_HD = re.search(r"hp\s+([0-9]+)\s+\(([0-9]+)d", stat_block)
+    HP_and_HD = _HP_HD_RE.search(stat_block)
     if HP_and_HD:
         monster.HP = int(HP_and_HD.group(1))
         monster.HD = int(HP_and_HD.group(2))
 
-    saving_throws = re.search(r"Fort\s+(0|\+[0-9]+|-[0-9]+)[\s\S]+"
-                              r"Ref\s+(0|\+[0-9]+|-[0-9]+)[\s\S]+"
-                              r"Will\s+(0|\+[0-9]+|-[0-9]+)",
-                              stat_block)
+    saving_throws = _SAVES_RE.search(stat_block)
     if saving_throws:
         monster.fortitude = int(saving_throws.group(1))
         monster.reflex = int(saving_throws.group(2))
@@ -224,23 +454,20 @@ def parse_offense(stat_block: str, monster: Monster) -> None:
     :param stat_block: string with the monster statistics block
     :param monster: Monster class object to fill
     """
-    speed = re.search(r"Speed\s+([0-9]+)", stat_block)
-    if speed:
-        monster.speed = int(speed.group(1))
-
-    for movement_type in ["burrow", "climb", "fly"]:
-        movement = re.search(movement_type + r"\s+([0-9]+)", stat_block)
-        if movement:
-            setattr(monster, movement_type, int(movement.group(1)))
-
-    attacks = re.search(r"(Melee|Ranged)([\s\S]+)"
-                        r"(Space|Reach|Special Attacks|Spell-Like Abilities)",
-                        stat_block)
+    _parse_simple_fields(stat_block, monster, _OFFENSE_FIELDS)
+
+    # a single pass catches all movement types at once; only the first
+    # occurrence of each type counts
+    for movement_type, value in _MOVEMENT_RE.findall(stat_block):
+        if not getattr(monster, movement_type):
+            setattr(monster, movement_type, int(value))
+
+    attacks = _ATTACKS_RE.search(stat_block)
     if attacks:
         attacks = attacks.group().split(")")
         attacks = [attack
                    for attack in attacks
-                   if re.search(r"[\s\S]+\([0-9]+d[\s\S]+", attack)]
+                   if _ATTACK_DMG_RE.search(attack)]
 
     if attacks:
         # attacks may now be empty e. g. if creature only has non-standard
@@ -280,11 +507,13 @@ def parse_offense(stat_block: str, monster: Monster) -> None:
             else:
                 ranged_logic.append("")
 
-        words_to_remove = {"Melee ", "Ranged ", " and ", " or "}
-        translation = "|".join(words_to_remove)
-        melee_attacks = [re.sub(translation, "", attack).strip()
+        # all four removed words are literals, so chained C-level replaces
+        # beat running the regex engine per attack
+        melee_attacks = [attack.replace("Melee ", "").replace("Ranged ", "")
+                         .replace(" and ", "").replace(" or ", "").strip()
                          for attack in melee_attacks]
-        ranged_attacks = [re.sub(translation, "", attack).strip()
+        ranged_attacks = [attack.replace("Melee ", "").replace("Ranged ", "")
+                          .replace(" and ", "").replace(" or ", "").strip()
                           for attack in ranged_attacks]
 
         melee_attacks = [parse_single_attack_type(attack)
@@ -295,40 +524,38 @@ def parse_offense(stat_block: str, monster: Monster) -> None:
         # this is highest possible attack bonus, it may or may not be used in
         # practice by creature (e. g. it is "or"-ed with attacks with higher
         # damage, but lower attack bonus)
-        monster.highest_attack_bonus = int(max([attack["highest_bonus"]
+        monster.highest_attack_bonus = int(max([attack.highest_bonus
                                                 for attack
                                                 in melee_attacks + ranged_attacks]))
 
         melee_attacks = process_attacks_logic(melee_attacks, melee_logic)
         ranged_attacks = process_attacks_logic(ranged_attacks, ranged_logic)
 
-        monster.melee_attacks_num = sum([attack["attacks_num"]
+        monster.melee_attacks_num = sum([attack.attacks_num
                                          for attack in melee_attacks])
         if melee_attacks:
-            full_damages = [attack["full_dmg"] for attack in melee_attacks]
-            full_damages = flatten(full_damages)
-            monster.melee_median_dmg = max(median(full_damages), 0)
+            # np.median runs a C selection instead of a Python sort
+            full_damages = np.fromiter(
+                (attack.full_dmg for attack in melee_attacks),
+                dtype=np.float32, count=len(melee_attacks))
+            monster.melee_median_dmg = max(float(np.median(full_damages)), 0)
         else:
             monster.melee_median_dmg = 0
 
-        monster.ranged_attacks_num = sum([attack["attacks_num"]
+        monster.ranged_attacks_num = sum([attack.attacks_num
                                           for attack in ranged_attacks])
         if ranged_attacks:
-            damages = [[attack["avg_dmg"]] * attack["attacks_num"]
-                       for attack in ranged_attacks]
-            damages = flatten(damages)
-            monster.ranged_median_dmg = max(median(damages), 0)
+            # repeat each average damage by its attack count and take the
+            # median over the expanded array in one vectorized step
+            damages = np.repeat(
+                np.fromiter((attack.avg_dmg for attack in ranged_attacks),
+                            dtype=np.float32, count=len(ranged_attacks)),
+                [attack.attacks_num for attack in ranged_attacks])
+            if damages.size:
+                monster.ranged_median_dmg = max(float(np.median(damages)), 0)
         else:
             monster.ranged_median_dmg = 0
 
-    space = re.search(r"Space\s+([0-9.]+)", stat_block)
-    if space:
-        monster.space = round(float(space.group(1)), 1)
-
-    reach = re.search(r"Reach\s+([0-9]+)", stat_block)
-    if reach:
-        monster.reach = int(reach.group(1))
-
 
 def parse_statistics(stat_block: str, monster: Monster) -> None:
     """
@@ -338,63 +565,46 @@ def parse_statistics(stat_block: str, monster: Monster) -> None:
     :param stat_block: string with the monster statistics block
     :param monster: Monster class object to fill
     """
-    attributes = {"Str": "strength",
-                  "Dex": "dexterity",
-                  "Con": "constitution",
-                  "Int": "intelligence",
-                  "Wis": "wisdom",
-                  "Cha": "charisma"}
-    for attr_short, attr_long in attributes.items():
-        regex = attr_short + r"\s*([0-9]+)"
-        attr_val = re.search(regex, stat_block)
-        if attr_val:
-            setattr(monster, attr_long, int(attr_val.group(1)))
-
-    BAB = re.search(r"Base\s*Atk\s*(0|\+[0-9]+|-[0-9]+)", stat_block)
-    if BAB:
-        monster.BAB = int(BAB.group(1))
-
-    CMB = re.search(r"CMB\s*(0|\+[0-9]+|-[0-9]+)", stat_block)
-    if CMB:
-        monster.CMB = int(CMB.group(1))
-
-    CMD = re.search(r"CMD\s*[-+]?(0|[0-9]+)", stat_block)
-    if CMD:
-        monster.CMD = int(CMD.group(1))
-
-    feats = re.search(r"Feats([\s\S]+?)Skills", stat_block)
+    # one scan over the block instead of a search per attribute; only the
+    # first occurrence of each attribute counts, like the old searches did
+    for attr_short, value in _ATTRIBUTES_RE.findall(stat_block):
+        attr_long = _ATTRIBUTE_NAMES[attr_short]
+        if getattr(monster, attr_long) is None:
+            setattr(monster, attr_long, int(value))
+
+    # the three values always appear together in this order, so one combined
+    # search covers the common case in a single scan
+    BAB_CMB_CMD = _BAB_CMB_CMD_RE.search(stat_block)
+    if BAB_CMB_CMD:
+        monster.BAB = int(BAB_CMB_CMD.group(1))
+        monster.CMB = int(BAB_CMB_CMD.group(2))
+        monster.CMD = int(BAB_CMB_CMD.group(3))
+    else:
+        # some blocks miss one of the values (e. g. "CMD -" for immobile
+        # creatures), fall back to per-field searches to get the others
+        BAB = _BAB_RE.search(stat_block)
+        if BAB:
+            monster.BAB = int(BAB.group(1))
+
+        CMB = _CMB_RE.search(stat_block)
+        if CMB:
+            monster.CMB = int(CMB.group(1))
+
+        CMD = _CMD_RE.search(stat_block)
+        if CMD:
+            monster.CMD = int(CMD.group(1))
+
+    feats = _FEATS_RE.search(stat_block)
     if feats:
-        feats = feats.group(1).strip().replace(",", "").split()
-        monster.feats_num = 0
-        # most feats have 1 or 2 words, the longest one has 6 words
-        # first try to find and remove 1-word feats, than 2-word etc.
-        to_remove = set()
-        for curr_length in range(1, 7):
-            i = 0
-            while i + curr_length <= len(feats):
-                feat = " ".join(feats[i:i + curr_length])
-                if feat in all_feats_names:
-                    monster.feats_num += 1
-                    # remove the words we used to create this feat name
-                    to_remove |= {j for j in range(i, i + curr_length)}
-                    i = i + curr_length
-                else:
-                    i += 1
-            feats = [feat for i, feat in enumerate(feats) if i not in to_remove]
-
-    skills = re.search(r"Skills([\s\S]+)", stat_block)
-    skills_names = {"Acrobatics", "Appraise", "Bluff", "Climb", "Diplomacy",
-                    "Disable Device", "Disguise", "Escape Artist", "Fly",
-                    "Handle Animal", "Heal", "Intimidate", "Linguistics",
-                    "Perception", "Perform", "Profession", "Ride",
-                    "Sense Motive", "Sleight of Hand", "Spellcraft",
-                    "Stealth", "Survival", "Swim", "Use Magic Device"}
+        monster.feats_num = _count_feats(feats.group(1))
+
+    skills = _SKILLS_RE.search(stat_block)
     if skills:
         skills = skills.group(1)
         # there are many Knowledge skills (e. g. Knowledge (nature)), so we
         # can just count this word
-        monster.skills_num = len(re.findall("Knowledge", skills))
-        monster.skills_num += len(re.findall("Craft", skills))
-        for skill in skills_names:
-            if skill in skills:
-                monster.skills_num += 1
+        monster.skills_num = len(_KNOWLEDGE_RE.findall(skills))
+        monster.skills_num += len(_CRAFT_RE.findall(skills))
+        # one alternation scan instead of a substring search per skill name;
+        # the set keeps the old semantics of counting each skill once
+        monster.skills_num += len(set(_SKILLS_ALT_RE.findall(skills)))
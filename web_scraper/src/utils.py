@@ -1,38 +1,142 @@
 import collections
+import json
 import re
-from typing import Dict, List, Set, Tuple, Union
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import List, NamedTuple, Set, Tuple, Union
 
 import requests
+from selectolax.lexbor import LexborHTMLParser
 
+# browser-like headers; the page may respond differently to unknown agents
+# (also used by the async crawler's aiohttp session)
+HEADERS = {"User-Agent": "Mozilla/5.0 (Macintosh; "
+                         "Intel Mac OS X 10_11_6) "
+                         "AppleWebKit/537.36 (KHTML, like Gecko) "
+                         "Chrome/61.0.3163.100 Safari/537.36"}
 
+_SESSION = None
+
+
+def _get_session():
+    """
+    Builds the shared HTTP session on first use. The session keeps
+    connections to d20pfsrd.com alive, so fetches reuse sockets instead of
+    paying a TLS handshake per page, and the cache backend stores responses
+    in a local sqlite file, so development reruns skip the network entirely
+    until entries expire.
+
+    Creating it lazily keeps the requests_cache import and the sqlite file
+    open off the module load path for code that never touches the network
+    (the pure parsing helpers and their tests).
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests_cache
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests_cache.CachedSession(
+            "d20pfsrd_cache", backend="sqlite",
+            expire_after=30 * 24 * 60 * 60)
+        _SESSION.mount("https://",
+                       requests.adapters.HTTPAdapter(
+                           pool_connections=32, pool_maxsize=32,
+                           max_retries=Retry(total=3, backoff_factor=0.3)))
+        _SESSION.headers.update(HEADERS)
+
+    return _SESSION
+
+# matches 3rd party content markers in links; compiled once instead of inside
+# the link-filtering comprehensions
+_THIRD_PARTY_RE = re.compile(r"3pp|tohc", re.IGNORECASE)
+
+# the feats list changes very rarely, so it is cached on disk and refreshed
+# at most once a week; this removes a network round-trip from every startup
+FEATS_CACHE = Path("~/.cache/pathfinder_scraper/feats.json").expanduser()
+FEATS_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days, in seconds
+
+_MONSTER_LINK_SELECTOR = \
+    'a[href^="https://www.d20pfsrd.com/bestiary/monster-listings/"]'
+
+# compiled once instead of per call, like the parser patterns in
+# monsters_scraper; these run for every crawled page
+_CONTENT_RE = re.compile(r'<!-- Content -->[\S\s]*'
+                         r'<div class="ogn-childpages"[\s\S]*'
+                         r'Subpages([\S\s]*?)'
+                         r'</div>')
+# the feats listing starts right after this header markup
+_GENERAL_FEATS_MARKER = "General Feats</a></span></h4>"
+# damage roll like "1d6", "2d8+4" or "1d4-1"; the bonus group is optional,
+# so one search covers both the bonus and no-bonus forms
+_DICE_RE = re.compile(r"([0-9]+)d([0-9]+)([+\-][0-9]+)?")
+
+_CRIT_RANGE_RE = re.compile(r"(1[0-9])-20")
+_CRIT_MULT_RE = re.compile(r"x[0-9]")
+
+_ATTACK_TYPE_RE = re.compile(r"melee|Melee|ranged|Ranged|touch")
+# fused pattern for the common well-formed attack shape
+# "name +X/+Y (AdB+C<crit...>": bonuses, damage roll and critical hit info
+# are captured in one pass (no closing parenthesis - the attacks were split
+# on it)
+_ATTACK_RE = re.compile(r"([0-9+\-/]+)\s+\("
+                        r"([0-9]+)d([0-9]+)([+\-][0-9]+)?(.*)")
+_BONUSES_RE = re.compile(r"([0-9+\-/]+)\s+\(")
+_BONUSES_FALLBACK_RE = re.compile(r"([0-9+\-/]+)\s*[a-zA-Z\-]+\s*\(")
+_HIGHEST_BONUS_RE = re.compile(r"\+[0-9]+|-[0-9]+")
+_NUM_ATTACKS_RE = re.compile(r"[0-9]+")
+_ATTACK_EFFECTS_RE = re.compile(r"\((.+)")
+_BONUS_DICE_RE = re.compile(r"(\+|plus)\s*([0-9]+)d([0-9]+)")
+
+
+@lru_cache(maxsize=4096)
 def get_page_content(link: str) -> bytes:
     """
     Makes request and returns response content if status code was OK.
+    Results are memoized per link, so pages reachable through several
+    index pages are only downloaded once per process.
 
     :param link: hyperlink to page
     :return: response content
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; "
-                             "Intel Mac OS X 10_11_6) "
-                             "AppleWebKit/537.36 (KHTML, like Gecko) "
-                             "Chrome/61.0.3163.100 Safari/537.36"}
-
-    response = requests.get(link, headers=headers)
-
-    html = response.content.decode("utf-8")
+    response = _get_session().get(link, timeout=30)
 
     # we can get 404 in 2 cases: true error or redirect page for malformed
     # URLs with suggestions; in the second case we should return content
-    # despite code 404
+    # despite code 404; checking the marker on the raw bytes avoids decoding
+    # the whole page just for this test
     if response.status_code != requests.codes.ok and \
-            "We've found at least one possible match" not in html:
+            b"We've found at least one possible match" not in response.content:
         raise ConnectionError("Page", link, "returned status code",
                               response.status_code)
 
     return response.content
 
 
-def flatten(iterable):
+def get_pages_content(links: List[str], max_workers: int = 8) -> List[bytes]:
+    """
+    Fetches multiple pages concurrently. The GIL is released during socket
+    I/O, so a small thread pool overlaps the network round-trips; all
+    threads share the pooled session, and per-link memoization still
+    applies.
+
+    :param links: hyperlinks to pages
+    :param max_workers: number of fetching threads
+    :return: response contents, in the order of links
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_page_content, links))
+
+
+# exact types flatten treats as leaves without any isinstance checks
+_SCALAR_TYPES = frozenset({str, int, float})
+_SEQUENCE_TYPES = frozenset({list, tuple})
+
+
+def flatten(iterable) -> list:
     """
     Flattens arbitrarily nested iterable structures.
     Warning: for dictionaries it only flattens keys and ignores values!
@@ -40,24 +144,36 @@ def flatten(iterable):
     :param iterable: nested iterables to be flattened
     :return: elements from all iterables flattened into the list
     """
-    # code shamelessly taken from StackOverflow, thanks to Noctis Skytower
-    # for this pretty solution
-    iterator = iter(iterable)
-    array, stack = collections.deque(), collections.deque()
-    while True:
-        try:
-            value = next(iterator)
-        except StopIteration:
-            if not stack:
-                return list(array)
-            iterator = stack.pop()
-        else:
-            if not isinstance(value, str) \
-                    and isinstance(value, collections.abc.Iterable):
-                stack.append(iterator)
-                iterator = iter(value)
+    # fast path: a plain list/tuple of flat lists/tuples - the common shape
+    # here - flattens in one C-level chain pass; the probe only does
+    # exact-type checks, so it stays cheap and anything deeper or more
+    # exotic falls through to the general loop
+    if type(iterable) in _SEQUENCE_TYPES \
+            and all(type(inner) in _SEQUENCE_TYPES
+                    and all(type(value) in _SCALAR_TYPES for value in inner)
+                    for inner in iterable):
+        return list(chain.from_iterable(iterable))
+
+    # explicit iterator stack instead of recursive generators: the common
+    # leaf types take the exact-type fast path, and there is no generator
+    # frame per nesting level; iterators are stateful, so a parent resumes
+    # where it stopped once its nested child is popped
+    result = []
+    stack = [iter(iterable)]
+    while stack:
+        for value in stack[-1]:
+            if type(value) in _SCALAR_TYPES:
+                result.append(value)
+            elif isinstance(value, collections.abc.Iterable) \
+                    and not isinstance(value, str):
+                stack.append(iter(value))
+                break
             else:
-                array.append(value)
+                result.append(value)
+        else:
+            stack.pop()
+
+    return result
 
 
 def get_monster_links(html_text: str) -> List[str]:
@@ -68,19 +184,16 @@ def get_monster_links(html_text: str) -> List[str]:
     :param html_text: page HTML code, decoded from content bytes as string
     :return: list of links
     """
-    links = re.findall(r"<a href=.+?</a>", html_text)
-
-    # some hyperlink list cleaning
-    # 3 list comprehensions turned out to be a degree of magnitude faster than 1 for loop
-
-    # filter out 3rd party content
-    links = [link for link in links
-             if not re.compile("3pp|3PP|tohc|TOHC").search(link)]
-
-    # get only hyperlinks
-    links = [re.match(r"<a href=\"(https://www.d20pfsrd.com/bestiary/monster-listings/.+?)\">", link)
-             for link in links]
-    links = [link.group(1) for link in links if link]
+    # one C-level CSS pass selects the monster anchors; the 3rd party marker
+    # can sit in the href or only in the link text (e.g. "Nightgaunt (3pp)"),
+    # so both are checked
+    links = []
+    for anchor in LexborHTMLParser(html_text).css(_MONSTER_LINK_SELECTOR):
+        href = anchor.attributes.get("href") or ""
+        if _THIRD_PARTY_RE.search(href) \
+                or _THIRD_PARTY_RE.search(anchor.text()):
+            continue
+        links.append(href)
 
     return links
 
@@ -91,15 +204,34 @@ def get_feats_names() -> Set[str]:
 
     :return: set of names of feats
     """
+    if FEATS_CACHE.exists() \
+            and time.time() - FEATS_CACHE.stat().st_mtime < FEATS_CACHE_TTL:
+        # interned names make the downstream feat-string comparisons hit
+        # the pointer-identity fast path
+        return {sys.intern(feat)
+                for feat in json.loads(FEATS_CACHE.read_text())}
+
     content_bytes: bytes = get_page_content("https://www.d20pfsrd.com/feats/")
     html: str = content_bytes.decode("utf-8")
-    html = re.search(r"General Feats</a></span></h4>([\s\S]+)", html).group(1)
-
-    feats = re.findall(r"<a href=\"https://www.d20pfsrd.com/feats/.*?\">(.*?)</a>", html)
-    feats = {re.search(r"(.+)\(|(.+)", feat).group() for feat in feats}
-    feats = {feat if not feat.endswith("(")
-             else feat[:-1].rstrip()
-             for feat in feats}
+    # skip navigation and sidebars; a plain substring find replaces the
+    # whole-document regex scan (str.index fails fast like the old pattern
+    # did if the page layout changes)
+    start = html.index(_GENERAL_FEATS_MARKER) + len(_GENERAL_FEATS_MARKER)
+    html = html[start:]
+
+    # a DOM-level CSS query is linear in tag count and replaces regex passes
+    # over the raw HTML
+    tree = LexborHTMLParser(html)
+    feats = set()
+    for anchor in tree.css('a[href^="https://www.d20pfsrd.com/feats/"]'):
+        feat = anchor.text()
+        if not feat:
+            continue
+        # strip the "(Combat)" etc. qualifier after the feat name
+        feats.add(sys.intern(feat.partition("(")[0].rstrip()))
+
+    FEATS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    FEATS_CACHE.write_text(json.dumps(sorted(feats)))
 
     return feats
 
@@ -112,11 +244,7 @@ def get_subpages_links(html_text: str) -> List[str]:
     :return: list of links to monster pages
     """
     # remove sidebars, get only main page content
-    content = re.search(r'<!-- Content -->[\S\s]*'
-                        r'<div class="ogn-childpages"[\s\S]*'
-                        r'Subpages([\S\s]*?)'
-                        r'</div>',
-                        html_text)
+    content = _CONTENT_RE.search(html_text)
     if not content:
         return []
     else:
@@ -124,15 +252,13 @@ def get_subpages_links(html_text: str) -> List[str]:
 
     links = get_monster_links(content)
 
-    # sometimes links are duplicated here, where some have "/" at the end, when some do not
-    links = [link if not link.endswith("/")
-             else link[:-1]
-             for link in links]
-
-    # guarantee uniqueness
-    return list(set(links))
+    # sometimes links are duplicated here, where some have "/" at the end,
+    # when some do not; dict.fromkeys deduplicates in one pass and, unlike a
+    # set, keeps the page order
+    return list(dict.fromkeys(link.rstrip("/") for link in links))
 
 
+@lru_cache(maxsize=64)
 def get_crit_info(text: str) -> Tuple[float, int]:
     """
     Calculates critical hit chance and multiplier from string. For example:
@@ -153,14 +279,14 @@ def get_crit_info(text: str) -> Tuple[float, int]:
         # may happen if there is no critical hit info, assume defaults
         return 0.05, 2
 
-    lower_bound = re.search(r"(1[0-9])-20", text)
+    lower_bound = _CRIT_RANGE_RE.search(text)
     if lower_bound:
         lower_bound = int(lower_bound.group(1))
         crit_chance = round((20 - lower_bound + 1) * 0.05, 2)
     else:
         crit_chance = 0.05
 
-    crit_multiplier = re.search(r"x[0-9]", text)
+    crit_multiplier = _CRIT_MULT_RE.search(text)
     if crit_multiplier:
         crit_multiplier = crit_multiplier.group()
         crit_multiplier = crit_multiplier[1:]  # remove "x"
@@ -171,101 +297,129 @@ def get_crit_info(text: str) -> Tuple[float, int]:
     return crit_chance, crit_multiplier
 
 
-def parse_single_attack_type(text: str) -> Dict[str, Union[int, float]]:
+class AttackInfo(NamedTuple):
+    """
+    Parsed stats of a single attack type. A NamedTuple is cheaper to
+    allocate than a dict with string keys and field access compiles to an
+    attribute load; being immutable, combined attacks are built with
+    _replace instead of mutation.
+    """
+    attacks_num: int = 0
+    highest_bonus: int = 0
+    avg_dmg: float = 0.0
+    full_dmg: float = 0.0
+
+
+def _average_damage(die_num: int, die_size: int, dmg_bonus: int,
+                    crit_chance: float, crit_multiplier: int) -> float:
+    """
+    Computes average damage of a single attack, rounded to the nearest 0.5.
+
+    X-sided die roll average value is just a mean (expected) value for
+    discrete uniform probability distribution with values in range [1, X],
+    therefore (1 + X) / 2. Critical hits are really just like additional
+    attacks with % of chances of happening, which directly changes their
+    damage, so they are included proportionately to the crit chance.
+
+    :param die_num: number of damage dice
+    :param die_size: number of sides on each die
+    :param dmg_bonus: flat damage bonus (may be negative)
+    :param crit_chance: critical hit chance
+    :param crit_multiplier: critical hit damage multiplier
+    :return: average damage per attack
+    """
+    avg_dmg = die_num * ((1 + die_size) * 0.5) + dmg_bonus
+    avg_dmg += crit_chance * avg_dmg * (crit_multiplier - 1)
+    return round(avg_dmg * 2) * 0.5
+
+
+def parse_single_attack_type(text: str) -> AttackInfo:
     """
     Parses single attack type string in format:
     ATTACK NAME +X/+Y/+Z/.../-A/-B (AdB+C/19-20)
     e. g. short sword +3 (1d6+1/19-20)
 
-    Returned dict:
-    - "attack_num" - number of attacks, e. g. for +5/+3/-5 it would be 3
-    - "highest_bonus" - largest attack bonus, e. g. for +5/+3/-5 it would be +5
-    - "avg_dmg" - average damage dealt with a single attack of this type;
+    Returned AttackInfo fields:
+    - attacks_num - number of attacks, e. g. for +5/+3/-5 it would be 3
+    - highest_bonus - largest attack bonus, e. g. for +5/+3/-5 it would be +5
+    - avg_dmg - average damage dealt with a single attack of this type;
     critical damage is included proportionately to the crit change (critical
     range)
+    - full_dmg - avg_dmg times attacks_num
 
     :param text: single attack string to parse
-    :return: dictionary with keys and values described above
+    :return: AttackInfo with fields described above
     """
-    result = {"attacks_num": 0,
-              "highest_bonus": 0,
-              "avg_dmg": 0,
-              "full_dmg": 0}
-
-    to_remove_regex = r"melee|Melee|ranged|Ranged|touch"
-    text = re.sub(to_remove_regex, "", text)
-
-    bonuses = re.search(r"([0-9+\-/]+)\s+\(", text)
-    if not bonuses:
-        # check if the attack bonus is not mismatched, e.g. +1 javelin (...)
-        # instead of proper javelin +0 (...)
-        # this has to be a fallback option, since we can have magical attacks
-        # like +1 longsword +6/+1 (...) and we want to capture 2nd group of
-        # numbers (+6/+1 here)
-        bonuses = re.search(r"([0-9+\-/]+)\s*[a-zA-Z\-]+\s*\(", text)
-
-    if bonuses:
+    # every pattern below requires an opening parenthesis, so a text
+    # without one (no attack effects) can only ever produce the defaults;
+    # one C-level substring test skips the whole cascade
+    if "(" not in text:
+        return AttackInfo()
+
+    text = _ATTACK_TYPE_RE.sub("", text)
+
+    # fast path: one fused search recognizes the common well-formed attack
+    # shape and captures bonuses, damage roll and critical hit info at once;
+    # irregular attacks (mismatched bonus like "+1 javelin (...)", damage
+    # roll not right after the parenthesis, no damage roll at all) fall
+    # through to the step-by-step passes below
+    attack = _ATTACK_RE.search(text)
+    if attack:
+        bonuses, die_num, die_size, dmg_bonus, crit_effect = attack.groups()
+        attack_effects_str = crit_effect
+    else:
+        bonuses = _BONUSES_RE.search(text)
+        if not bonuses:
+            # check if the attack bonus is not mismatched, e.g. +1 javelin
+            # (...) instead of proper javelin +0 (...)
+            # this has to be a fallback option, since we can have magical
+            # attacks like +1 longsword +6/+1 (...) and we want to capture
+            # 2nd group of numbers (+6/+1 here)
+            bonuses = _BONUSES_FALLBACK_RE.search(text)
+
+        if not bonuses:
+            return AttackInfo()
         bonuses = bonuses.group(1)
-        result["attacks_num"] = bonuses.count("/") + 1
 
-        bonuses = re.search(r"\+[0-9]+|-[0-9]+", bonuses).group()
-        # since bonuses are always sorted descending, we can take the first one
-        result["highest_bonus"] = int(bonuses)
-    else:
-        return result
+        attack_effects = _ATTACK_EFFECTS_RE.search(text)
+        if attack_effects:
+            attack_effects_str = attack_effects.group(1)
 
-    if result["attacks_num"] == 1:
-        # attacks could be natural attacks, in which case there are no "/",
-        # multiple attacks are denoted by number before attack name
-        num_attacks = re.match(r"[0-9]+", text)
-        if num_attacks:
-            num_attacks = num_attacks.group()
-            result["attacks_num"] = int(num_attacks)
-
-    attack_effects = re.search(r"\((.+)", text)
-    if attack_effects:
-        attack_effects_str = attack_effects.group(1)
-        attack_effects = re.search(r"([0-9]+d[0-9]+[+|\-][0-9]+)(.*)|"
-                                   r"([0-9]+d[0-9]+)(.*)",
-                                   attack_effects_str)
-
-        damage = attack_effects.group(1) if attack_effects.group(1) \
-            else attack_effects.group(3)
-        crit_effect = attack_effects.group(2) if attack_effects.group(2) \
-            else attack_effects.group(4)
-
-        damage = re.match(r"([0-9]+)d([0-9]+)([+|\-][0-9]+|)", damage)
-        die_num = int(damage.group(1))
-        die_size = int(damage.group(2))
-        dmg_bonus = int(damage.group(3)) if damage.group(3) else 0
-
-        # X-sided die roll average value is just a mean (expected) value for
-        # discrete uniform probability distribution with values in range [1, X]
-        # therefore (1 + X) / 2
-        avg_dmg = die_num * ((1 + die_size) / 2) + dmg_bonus
-
-        # use critical hits in average damage calculation: critical hits are
-        # really just like additional attacks with % of chances of happening,
-        # which directly changes their damage
-        crit_chance, crit_multiplier = get_crit_info(crit_effect)
+            # one search grabs the whole damage roll; everything after it
+            # is the critical hit info (if any)
+            damage = _DICE_RE.search(attack_effects_str)
+            crit_effect = attack_effects_str[damage.end():]
+            die_num, die_size, dmg_bonus = damage.groups()
+        else:
+            attack_effects_str = None
 
-        avg_dmg += crit_chance * avg_dmg * (crit_multiplier - 1)
-        avg_dmg = round(avg_dmg * 2) / 2  # round to nearest 0.5
+    attacks_num = bonuses.count("/") + 1
 
-        result["avg_dmg"] = avg_dmg
+    # since bonuses are always sorted descending, we can take the first one
+    highest_bonus = int(_HIGHEST_BONUS_RE.search(bonuses).group())
 
-        for _, die_num, die_size in re.findall(
-                r"(\+|plus)\s*([0-9]+)d([0-9]+)", attack_effects_str):
-            die_num = int(die_num)
-            die_size = int(die_size)
-            avg_bonus_dmg = die_num * ((1 + die_size) / 2)
-            avg_dmg += avg_bonus_dmg
+    if attacks_num == 1:
+        # attacks could be natural attacks, in which case there are no "/",
+        # multiple attacks are denoted by number before attack name
+        num_attacks = _NUM_ATTACKS_RE.match(text)
+        if num_attacks:
+            attacks_num = int(num_attacks.group())
 
-        result["avg_dmg"] = avg_dmg
+    avg_dmg = 0.0
+    if attack_effects_str is not None:
+        crit_chance, crit_multiplier = get_crit_info(crit_effect)
+        avg_dmg = _average_damage(int(die_num), int(die_size),
+                                  int(dmg_bonus) if dmg_bonus else 0,
+                                  crit_chance, crit_multiplier)
 
-    result["full_dmg"] = result["attacks_num"] * result["avg_dmg"]
+        for _, die_num, die_size in _BONUS_DICE_RE.findall(
+                attack_effects_str):
+            avg_dmg += int(die_num) * ((1 + int(die_size)) * 0.5)
 
-    return result
+    return AttackInfo(attacks_num=attacks_num,
+                      highest_bonus=highest_bonus,
+                      avg_dmg=avg_dmg,
+                      full_dmg=attacks_num * avg_dmg)
 
 
 def process_attacks_logic(attacks, logic):
@@ -278,65 +432,47 @@ def process_attacks_logic(attacks, logic):
     avg_dmg, attacks_num, highest_bonus.
     If all of those fail, the attack with lower index is retained.
 
-    :param attacks: list of dictionaries with individual attack types' stats
+    :param attacks: list of AttackInfo with individual attack types' stats
     :param logic: list of elements "and"/"or"/"" (logical operator between
     this and previous attack, or lack thereof)
     """
-    attacks = attacks.copy()
     if not attacks:
         return []
 
     # "and" binds stronger than "or", so we group attacks first, then take
-    # alternatives
-
-    # iterating with indices descending avoids problems with indexing while
-    # iterating and deleting elements
-
-    # "and" part
-    i = len(attacks)
-    while i > 0:
-        i -= 1
-        if logic[i] == "and":
-            # current attack and previous one are "and"-ed
-            prev_atk = attacks[i - 1]
-            curr_atk = attacks[i]
-
-            prev_atk["highest_bonus"] = max(prev_atk["highest_bonus"],
-                                            curr_atk["highest_bonus"])
-            for attr in ["avg_dmg", "attacks_num", "full_dmg"]:
-                prev_atk[attr] = prev_atk[attr] + curr_atk[attr]
-
-            del attacks[i]
-            del logic[i]
-
-    # "or" part
-    i = len(attacks)
-    while i > 0:
-        i -= 1
-        if logic[i] == "or":
-            # current attack and previous one are "or"-ed
-            prev_atk = attacks[i - 1]
-            curr_atk = attacks[i]
-            choice = None  # choose attack to delete
-            for feature in ["full_dmg", "avg_dmg", "attacks_num",
-                            "highest_bonus"]:
-                prev = prev_atk[feature]
-                curr = curr_atk[feature]
-                if prev < curr:
-                    # choose prev_atk to delete
-                    choice = i - 1
-                    break
-                elif prev > curr:
-                    # choose curr_atk to delete
-                    choice = i
-                    break
-                # else values equal, need to check further features
-
-            if choice is not None:
-                # found unequal value to choose
-                del attacks[choice]
-            else:
-                # everything was tied, remove curr_atk
-                del attacks[i]
+    # alternatives; both passes build new lists front to back, instead of
+    # deleting in place, which shifted the tail of the list on every removal
+
+    # "and" part: fold each "and"-ed attack into the previous surviving one
+    merged = []
+    merged_logic = []
+    for attack, operator in zip(attacks, logic):
+        if operator == "and" and merged:
+            prev_atk = merged[-1]
+            merged[-1] = prev_atk._replace(
+                attacks_num=prev_atk.attacks_num + attack.attacks_num,
+                highest_bonus=max(prev_atk.highest_bonus,
+                                  attack.highest_bonus),
+                avg_dmg=prev_atk.avg_dmg + attack.avg_dmg,
+                full_dmg=prev_atk.full_dmg + attack.full_dmg)
+        else:
+            merged.append(attack)
+            merged_logic.append(operator)
+
+    # "or" part: keep the stronger side of each alternative; the tuple
+    # comparison checks the features in priority order and the strict ">"
+    # keeps the earlier attack on a full tie
+    result = []
+    for attack, operator in zip(merged, merged_logic):
+        if operator == "or" and result:
+            prev_atk = result[-1]
+            prev_key = (prev_atk.full_dmg, prev_atk.avg_dmg,
+                        prev_atk.attacks_num, prev_atk.highest_bonus)
+            curr_key = (attack.full_dmg, attack.avg_dmg,
+                        attack.attacks_num, attack.highest_bonus)
+            if curr_key > prev_key:
+                result[-1] = attack
+        else:
+            result.append(attack)
 
-    return attacks
+    return result
@@ -9,27 +9,36 @@ from web_scraper.src.monsters_scraper import parse_basic_info, parse_defense, \
     parse_offense, parse_statistics
 
 
+# compiled once per test session instead of on every fixture call, like the
+# module-level patterns in the scraper itself
+_STAT_BLOCK_RE = re.compile(
+    r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?)SPECIAL ABILITIES|"
+    r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?STATISTICS[\S\s]*?)\n\n|"
+    r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?STATISTICS[\S\s]*)")
+_NAME_RE = re.compile(r"\n(.+)[ ]+\(?CR")
+_BASIC_INFO_RE = re.compile(r"([\s\S]+)DEFENSE")
+_DEFENSE_RE = re.compile(r"DEFENSE([\s\S]+)OFFENSE")
+_OFFENSE_RE = re.compile(r"OFFENSE([\s\S]+)(TACTICS|STATISTICS)")
+_STATISTICS_RE = re.compile(r"STATISTICS([\s\S]+)")
+
+
 def get_parts(text: str) -> Tuple[str, str, str, str, str]:
     text = text.replace("–", "-")
 
-    stat_block = re.search(r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?)SPECIAL ABILITIES|"
-                           r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?STATISTICS[\S\s]*?)\n\n|"
-                           r"(CR\s+[0-9/]+\)?\s+XP[\S\s]*?STATISTICS[\S\s]*)",
-                           text).group(1)
+    stat_block = _STAT_BLOCK_RE.search(text).group(1)
 
-    name = re.search(r"\n(.+)[ ]+\(?CR", text)
+    name = _NAME_RE.search(text)
     name = name.group(1).strip() if name else ""
 
-    basic_info_block = re.search(r"([\s\S]+)DEFENSE", stat_block).group(1)
-    defense_block = re.search(r"DEFENSE([\s\S]+)OFFENSE", stat_block).group(1)
-    offense_block = re.search(r"OFFENSE([\s\S]+)(TACTICS|STATISTICS)",
-                              stat_block).group(1)
-    statistics_block = re.search(r"STATISTICS([\s\S]+)", stat_block).group(1)
+    basic_info_block = _BASIC_INFO_RE.search(stat_block).group(1)
+    defense_block = _DEFENSE_RE.search(stat_block).group(1)
+    offense_block = _OFFENSE_RE.search(stat_block).group(1)
+    statistics_block = _STATISTICS_RE.search(stat_block).group(1)
 
     return name, basic_info_block, defense_block, offense_block, statistics_block
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_tiefling() -> Tuple[str, str, str, str, str]:
     with open("example_monsters/tiefling.txt") as file:
         text = file.read()
@@ -37,7 +46,7 @@ def get_tiefling() -> Tuple[str, str, str, str, str]:
     return get_parts(text)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_planetar() -> Tuple[str, str, str, str, str]:
     with open("example_monsters/planetar.txt") as file:
         text = file.read()
@@ -45,7 +54,7 @@ def get_planetar() -> Tuple[str, str, str, str, str]:
     return get_parts(text)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_minotaur() -> Tuple[str, str, str, str, str]:
     with open("example_monsters/minotaur.txt") as file:
         text = file.read()
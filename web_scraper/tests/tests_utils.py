@@ -77,25 +77,25 @@ def test_crit_chance_range_and_multiplier():
 def test_parse_simple_attack_type():
     attack_str = "short sword +5 (1d6+1/19-20)"
     attack_info = parse_single_attack_type(attack_str)
-    assert attack_info["attacks_num"] == 1
-    assert attack_info["highest_bonus"] == 5
-    assert math.isclose(attack_info["avg_dmg"], 5.0)
+    assert attack_info.attacks_num == 1
+    assert attack_info.highest_bonus == 5
+    assert math.isclose(attack_info.avg_dmg, 5.0)
 
 
 def test_parse_multiple_attacks():
     attack_str = "short sword +11/+6/+1/-4 (1d6+1/19-20)"
     attack_info = parse_single_attack_type(attack_str)
-    assert attack_info["attacks_num"] == 4
-    assert attack_info["highest_bonus"] == 11
-    assert math.isclose(attack_info["avg_dmg"], 5.0)
+    assert attack_info.attacks_num == 4
+    assert attack_info.highest_bonus == 11
+    assert math.isclose(attack_info.avg_dmg, 5.0)
 
 
 def test_negative_attack_bonus():
     attack_str = "short sword -1 (1d6+1/19-20)"
     attack_info = parse_single_attack_type(attack_str)
-    assert attack_info["attacks_num"] == 1
-    assert attack_info["highest_bonus"] == -1
-    assert math.isclose(attack_info["avg_dmg"], 5.0)
+    assert attack_info.attacks_num == 1
+    assert attack_info.highest_bonus == -1
+    assert math.isclose(attack_info.avg_dmg, 5.0)
 
 
 